@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 
+# Module imports
+from .frozen_slots import FrozenSlots
 
-@dataclass
-class AccelerometerData:
+
+@dataclass(frozen=True)
+class AccelerometerData(FrozenSlots):
     """! Represents the accelerometer data from the DWM1001-DEV module.
 
     Attributes:
@@ -17,11 +20,32 @@ class AccelerometerData:
     - The LIS2DH12TR can be accessed via TWI/I2C on address 0x33.
 
     - These values are on a 2g full scale range (by default).
-    - To get the acceleration in gravities, divide by 2^6.
-    - To get m/s^2, convert to gravities and then multiply by 0.004.
+    - To get the acceleration in gravities, divide by 2^6 and multiply by 0.004 (4 mg/digit).
+    - To get m/s^2, multiply gravities by standard gravity (9.80665 m/s^2).
+    - The x_mps2, y_mps2 and z_mps2 properties do this conversion.
 
     """
 
+    __slots__ = ("x_raw", "y_raw", "z_raw")
+
+    # raw / 2^6 * 0.004 g * 9.80665 m/s^2 per g, folded into one multiply
+    __MPS2_PER_RAW = 0.004 / 64 * 9.80665
+
     x_raw: int
     y_raw: int
     z_raw: int
+
+    @property
+    def x_mps2(self) -> float:
+        """! X-axis acceleration in m/s^2."""
+        return self.x_raw * self.__MPS2_PER_RAW
+
+    @property
+    def y_mps2(self) -> float:
+        """! Y-axis acceleration in m/s^2."""
+        return self.y_raw * self.__MPS2_PER_RAW
+
+    @property
+    def z_mps2(self) -> float:
+        """! Z-axis acceleration in m/s^2."""
+        return self.z_raw * self.__MPS2_PER_RAW
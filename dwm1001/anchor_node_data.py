@@ -1,16 +1,24 @@
 from dataclasses import dataclass
 import re
 
-
 # Module imports
+from .frozen_slots import FrozenSlots
 from .exceptions import ParsingError
 from .tag_position import TagPosition
 
+# Groups: id, seat, seens, x, y, z
+_ANCHOR_RE = re.compile(
+    r"id=([0-9A-F]+) seat=(\d+) idl=\d+ seens=(\d+) lqi=\d+ fl=\d+ map=\d+ "
+    r"pos=(-?[0-9.]+):(-?[0-9.]+):(-?[0-9.]+)"
+)
+
 
-@dataclass
-class AnchorNodeData:
+@dataclass(frozen=True)
+class AnchorNodeData(FrozenSlots):
     """! Represents an anchor node in the system."""
 
+    __slots__ = ("id", "seat", "seens", "position")
+
     id: str
     seat: int
     seens: int
@@ -23,14 +31,46 @@ class AnchorNodeData:
         # Example: [003976.630 INF]   1) id=0000000000008389 seat=3 idl=0 seens=116 lqi=0 fl=5001 map=00000002 pos=4.96:2.50:1.78
         # Example: [003976.640 INF]   2) id=0000000000000E0B seat=4 idl=0 seens=103 lqi=0 fl=5001 map=00000002 pos=0.64:8.63:1.13
         # pos=0.64:8.63:1.13  # x:y:z
-        pattern = r"id=(?P<id>[0-9A-F]+) seat=(?P<seat>\d+) idl=\d+ seens=(?P<seens>\d+) lqi=\d+ fl=\d+ map=\d+ pos=(?P<pos>[0-9.:-]+)"
-        match = re.search(pattern, anchor_line)
+        match = _ANCHOR_RE.search(anchor_line)
         if match is None:
             raise ParsingError("Could not parse anchor line.")
-        id = match.group("id")
-        seat = int(match.group("seat"))
-        seens = int(match.group("seens"))
-        position_str = match.group("pos")
-        x_str, y_str, z_str = position_str.split(":")
+        return AnchorNodeData._from_match(match)
+
+    @staticmethod
+    def list_from_string(anchor_list_str: str) -> list:
+        """! Parses every anchor line in a 'la' command output in a single regex pass.
+        @param anchor_list_str (str): The output of the 'la' command.
+        @return list[AnchorNodeData]: A list of AnchorNodeData instances.
+        """
+        return [
+            AnchorNodeData._from_match(match)
+            for match in _ANCHOR_RE.finditer(anchor_list_str)
+        ]
+
+    @staticmethod
+    def table_from_string(anchor_list_str: str) -> tuple:
+        """! Parses every anchor line in a 'la' command output into per-field sequences.
+        @param anchor_list_str (str): The output of the 'la' command.
+        @return tuple[tuple, ...]: The ids, seats, seens, x, y and z values of every anchor,
+        one tuple per field (e.g. ready for numpy.array() in distance computations).
+
+        Unlike list_from_string, no AnchorNodeData or TagPosition objects are created.
+        """
+        rows = _ANCHOR_RE.findall(anchor_list_str)
+        if not rows:
+            return ((), (), (), (), (), ())
+        ids, seats, seens, x_strs, y_strs, z_strs = zip(*rows)
+        return (
+            ids,
+            tuple(map(int, seats)),
+            tuple(map(int, seens)),
+            tuple(map(float, x_strs)),
+            tuple(map(float, y_strs)),
+            tuple(map(float, z_strs)),
+        )
+
+    @staticmethod
+    def _from_match(match: "re.Match") -> "AnchorNodeData":
+        id, seat, seens, x_str, y_str, z_str = match.groups()
         position = TagPosition(float(x_str), float(y_str), float(z_str), 0)
-        return AnchorNodeData(id, seat, seens, position)
+        return AnchorNodeData(id, int(seat), int(seens), position)
@@ -0,0 +1,135 @@
+#
+#   Qovro UWB Positioning System
+#   DecaWave DWM1001 Module
+#   asyncio wrapper for the serial interface
+#
+
+# Standard library imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# DWM1001 module imports
+from .dwm1001 import DWM1001Node
+from .tag_position import TagPosition
+from .accelerometer_data import AccelerometerData
+from .anchor_node_data import AnchorNodeData
+from .node_mode import NodeMode
+from .shell_command import ShellCommand
+from .system_info import SystemInfo
+
+
+class AsyncDWM1001Node:
+    """! asyncio interface to a DWM1001Node.
+
+    Serial I/O runs on a single worker thread, so commands are still serialized on the
+    UART in submission order, while response parsing runs on the event loop. Queries
+    issued together with asyncio.gather() keep the UART busy: the next command is
+    written as soon as the previous prompt arrives, overlapping with parsing.
+
+    @param node (DWM1001Node): A DWM1001Node; connect() it before issuing queries.
+
+    The worker thread starts on the first call and stops on close() (or on leaving an
+    'async with' block); a closed node starts a new worker if used again. Like
+    DWM1001Node, it can be connected and disconnected repeatedly.
+
+    Example usage:
+      - async with AsyncDWM1001Node(DWM1001Node(serial_handle)) as node:
+      -     await node.connect()
+      -     uptime_ms, position = await asyncio.gather(node.get_uptime_ms(), node.get_position())
+      -     await node.disconnect()
+    """
+
+    def __init__(self, node: DWM1001Node) -> None:
+        """! Constructor for AsyncDWM1001Node class.
+        @param node (DWM1001Node): The synchronous node used for serial I/O."""
+        self.__node = node
+        self.__executor = None  # Started on first use, see __run()
+
+    async def __aenter__(self) -> "AsyncDWM1001Node":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def __run(self, function, *args):
+        if self.__executor is None:
+            # One worker keeps commands in order on the single UART
+            self.__executor = ThreadPoolExecutor(max_workers=1)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, function, *args)
+
+    async def close(self) -> None:
+        """! Stops the I/O worker thread once queued calls finish.
+
+        Does not touch the DWM1001; disconnect() first to reset it.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+    async def connect(self) -> None:
+        """! Connects to the DWM1001 device."""
+        await self.__run(self.__node.connect)
+
+    async def disconnect(self) -> None:
+        """! Disconnects from the DWM1001 device and resets to binary (non-shell) interface."""
+        await self.__run(self.__node.disconnect)
+
+    async def get_command_output(self, command: ShellCommand) -> str:
+        """! Sends a shell command to the DWM1001 and returns the output.
+        @param command (ShellCommand): The shell command to send.
+        @return str: The output of the shell command."""
+        return await self.__run(self.__node.get_command_output, command)
+
+    async def get_uptime_ms(self) -> int:
+        """! Gets the uptime of the DWM1001 in milliseconds."""
+        uptime_str = await self.get_command_output(ShellCommand.GET_UPTIME)
+        return self.__node._parse_uptime_str(uptime_str)
+
+    async def get_position(self) -> TagPosition:
+        """! Gets the position of the tag from the DWM1001.
+        @return TagPosition: The position of the tag."""
+        location_str = await self.get_command_output(ShellCommand.GET_POSITION)
+        return TagPosition.from_string(location_str)
+
+    async def get_accelerometer_data(self) -> AccelerometerData:
+        """! Gets a sample of the accelerometer data from the DWM1001.
+        @return AccelerometerData: The accelerometer data with x,y,z values."""
+        accelerometer_str = await self.get_command_output(
+            ShellCommand.GET_ACCELEROMETER
+        )
+        return self.__node._parse_accelerometer_str(accelerometer_str)
+
+    async def get_system_info(self) -> str:
+        """! Gets the system info of the DWM1001.
+        @return str: The output of the 'si' command."""
+        return await self.__run(self.__node.get_system_info)
+
+    async def get_system_info_parsed(self) -> SystemInfo:
+        """! Gets the commonly used system info fields with a single 'si' command.
+        @return SystemInfo: The BLE address and network ID of the DWM1001, each None if
+        missing from the 'si' output."""
+        return await self.__run(self.__node.get_system_info_parsed)
+
+    async def get_ble_address(self) -> str:
+        """! Gets the Bluetooth Low Energy (BLE) address of the DWM1001.
+        @return str: The BLE hardware/MAC address of the DWM1001."""
+        # Runs on the worker so the node's system info cache is shared, cleared on reset
+        return await self.__run(self.__node.get_ble_address)
+
+    async def get_network_id(self) -> str:
+        """! Gets the network ID (the hex name) the DWM1001 is associated with.
+        @return str: The network ID of the DWM1001."""
+        return await self.__run(self.__node.get_network_id)
+
+    async def get_node_mode(self) -> NodeMode:
+        """! Gets the node mode of the DWM1001.
+        @return NodeMode: The node mode of the DWM1001."""
+        node_mode_str = await self.__run(self.__node.get_node_mode_str)
+        return self.__node._parse_node_mode_str(node_mode_str)
+
+    async def get_list_of_anchors(self) -> list:
+        """! Gets a list of anchors currently seen by the DWM1001.
+        @return list[AnchorNodeData]: A list of AnchorNodeData instances."""
+        anchor_list_str = await self.get_command_output(ShellCommand.GET_ANCHOR_LIST)
+        return AnchorNodeData.list_from_string(anchor_list_str)
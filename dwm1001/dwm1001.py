@@ -5,24 +5,65 @@
 #
 
 # Standard library imports
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from typing import Union
+import os
 import time
 import logging
 import re
+import struct
+
+try:  # POSIX only, used to enable low latency mode on USB serial ports
+    import fcntl
+    import termios
+except ImportError:
+    fcntl = None
+    termios = None
 
 # Third party imports
 from serial import Serial
-import pexpect_serial
+from serial.serialutil import Timeout
 import pexpect
 
 # DWM1001 module imports
-from .exceptions import ParsingError, ReservedGPIOPinError
+from .exceptions import ParsingError, ReservedGPIOPinError, ActiveStreamError
 from .tag_position import TagPosition
 from .accelerometer_data import AccelerometerData
 from .anchor_node_data import AnchorNodeData
 from .node_mode import NodeMode
 from .shell_command import ShellCommand
+from .system_info import SystemInfo
+
+# Precompiled shell output parsing patterns
+_BLE_RE = re.compile(r"ble: addr=([0-9A-F:]+)")
+_PANID_RE = re.compile(r"panid=(x[0-9A-F]+) addr=")
+_ACC_RE = re.compile(r"acc: x = (-?\d+), y = (-?\d+), z = (-?\d+)")
+_AN_CNT_RE = re.compile(r"AN: cnt=(\d+) seq=")
+
+# Raw command strings for the hot getters, so each call skips the Enum member lookup
+_CMD_UT = ShellCommand.GET_UPTIME.value
+_CMD_APG = ShellCommand.GET_POSITION.value
+_CMD_AV = ShellCommand.GET_ACCELEROMETER.value
+_CMD_LA = ShellCommand.GET_ANCHOR_LIST.value
+_CMD_GG = ShellCommand.GPIO_GET.value
+_CMD_GS = ShellCommand.GPIO_SET.value
+_CMD_GC = ShellCommand.GPIO_CLEAR.value
+
+# Shell command lines, pre-encoded and terminated for writing to the serial port.
+# Keyed by both the ShellCommand and its raw string (str hashing is cheaper).
+_COMMAND_BYTES = {}
+for _command in ShellCommand:
+    _COMMAND_BYTES[_command] = _COMMAND_BYTES[_command.value] = _command.line_bytes
+del _command
+
+# Node mode shell tokens, as in "mode: tn (act,twr,np,le)"
+_NODE_MODE_TOKENS = {
+    "tn": NodeMode.TAG,
+    "an": NodeMode.ANCHOR,
+    "ani": NodeMode.ANCHOR_INITIATOR,
+}
 
 
 class DWM1001Node:
@@ -41,40 +82,98 @@ class DWM1001Node:
       - dwm1001.disconnect()
     """
 
-    # These delay periods were experimentally determined
-    __RESET_DELAY_PERIOD = 0.1
+    # Upper bound on the reboot, not measured: reset() returns on the first probe reply
+    __RESET_TIMEOUT_SEC = 2.0
+
+    # Slow-changing command outputs (system info, node mode) are reused for this long
+    __COMMAND_CACHE_TTL_SEC = 0.1
+    __NODE_MODE_CACHE_TTL_SEC = 0.5  # Node mode rarely changes, cleared on reset
 
     __SHELL_PROMPT = "dwm> "
-    __BINARY_MODE_RESPONSE = "@\x01\x01"
+    __SHELL_PROMPT_BYTES = __SHELL_PROMPT.encode()
+    __MAX_RESPONSE_BYTES = 8192
+    __BINARY_MODE_RESPONSE = b"@\x01\x01"
+    __MODE_PROBE_RESPONSES = (__BINARY_MODE_RESPONSE, __SHELL_PROMPT_BYTES)
+    # Either probe reply arrives within a few ms at 115200 baud
+    __MODE_PROBE_TIMEOUT_SEC = 0.2
+    __SHELL_ENTRY_SETTLE_SEC = 0.05  # Quiet period that ends the shell mode entry
+    __READ_POLL_SEC = 0.001  # Wait between input checks while no bytes are buffered
 
     __LED_GPIO_PIN = 14
+    __VALID_GPIO_PINS = frozenset({2, 8, 9, 10, 12, 13, 14, 15, 23, 27})
+
+    # Linux serial_struct flag, lowers the USB serial latency timer from 16ms to 1ms
+    __ASYNC_LOW_LATENCY = 1 << 13
+    __SERIAL_STRUCT_FLAGS_OFFSET = 16
 
     def __init__(self, serial_handle: Serial, shell_timeout_sec=3.0) -> None:
         """! Constructor for UartDwm1001 class.
-        @param serial_handle (Serial): An already open Serial handle to the DWM1001 device."""
+        @param serial_handle (Serial): An already open Serial handle to the DWM1001 device.
+        """
         self.__log = logging.getLogger(__class__.__name__)
         self.__serial_handle = serial_handle
-        self.__pexpect_handle = pexpect_serial.SerialSpawn(
-            self.__serial_handle, timeout=shell_timeout_sec
-        )
+        # Deadlines are enforced while reading, the handle's own timeout is left as set
+        self.__shell_timeout_sec = shell_timeout_sec
+        if hasattr(self.__serial_handle, "set_buffer_size"):  # Windows only
+            self.__serial_handle.set_buffer_size(rx_size=16384)
+        self.__set_low_latency()
+        self.__command_output_cache = {}
+        self.__system_info_cache = None
+        self.__in_shell_mode = False  # Set once the shell prompt has been seen
+        self.__pending_input = bytearray()  # Bytes read past the last consumed prompt
+        self.__active_stream_command = None  # Command repeated by an open stream
 
     def connect(self) -> None:
         """! Connects to the DWM1001 device."""
+        # Drop stale bytes (boot banner, output of earlier sessions) before probing
+        self.__serial_handle.reset_input_buffer()
+        self.__pending_input.clear()
         if not self.is_in_shell_mode():
             self.__log.debug("Not in shell mode, initializing shell.")
             try:
-                self.enter_shell_mode()
+                self.__send_shell_mode_entry()  # Mode already probed above
             except pexpect.exceptions.TIMEOUT:
                 self.__log.warning("Connect failed.")
                 raise pexpect.exceptions.TIMEOUT("Shell mode response timeout.")
         else:
             self.__log.debug("Already in shell mode.")
         serial_port_path = self.__serial_handle.name
-        self.__log.info(f"Connected to DWM1001 on: {serial_port_path}")
-        self.__clear_pexpect_buffer()
+        self.__log.info("Connected to DWM1001 on: %s", serial_port_path)
+
+    def __set_low_latency(self) -> None:
+        """! Best effort reduction of the USB serial latency timer (setserial low_latency).
 
-    def __clear_pexpect_buffer(self) -> None:
-        self.__pexpect_handle.before = ""  # Clear buffer
+        Every shell command otherwise waits up to 16ms for the USB serial driver to hand
+        back its response. Non-Linux hosts, non-USB ports, and handles without a device
+        path are left unchanged.
+        """
+        port_path = getattr(self.__serial_handle, "name", None)
+        if not port_path:
+            return
+        port_name = os.path.basename(port_path)
+        latency_timer_path = f"/sys/bus/usb-serial/devices/{port_name}/latency_timer"
+        try:
+            with open(latency_timer_path, "wb") as latency_timer:
+                latency_timer.write(b"1")
+            self.__log.debug("Set latency timer to 1ms on: %s", port_name)
+        except OSError:
+            self.__log.debug("No USB serial latency timer for: %s", port_name)
+
+        if fcntl is None or not hasattr(termios, "TIOCGSERIAL"):
+            return
+        try:
+            serial_struct = bytearray(128)
+            fd = self.__serial_handle.fileno()
+            fcntl.ioctl(fd, termios.TIOCGSERIAL, serial_struct)
+            offset = self.__SERIAL_STRUCT_FLAGS_OFFSET
+            (flags,) = struct.unpack_from("i", serial_struct, offset)
+            struct.pack_into(
+                "i", serial_struct, offset, flags | self.__ASYNC_LOW_LATENCY
+            )
+            fcntl.ioctl(fd, termios.TIOCSSERIAL, serial_struct)
+            self.__log.debug("Set ASYNC_LOW_LATENCY on: %s", port_name)
+        except (OSError, AttributeError, ValueError):
+            self.__log.debug("Could not set ASYNC_LOW_LATENCY on: %s", port_name)
 
     def disconnect(self) -> None:
         """! Disconnects from the DWM1001 device and resets to binary (non-shell) interface."""
@@ -83,68 +182,287 @@ class DWM1001Node:
 
     def get_uptime_ms(self) -> int:
         """! Gets the uptime of the DWM1001 in milliseconds."""
-        uptime_str = self.get_command_output(ShellCommand.GET_UPTIME.value)
+        uptime_str = self.get_command_output(_CMD_UT)
         return self._parse_uptime_str(uptime_str)
 
     def _parse_uptime_str(self, uptime_str: str) -> int:
-        _, right = uptime_str.split(" (")
-        uptime_ms_str, _ = right.split(" ms")
+        # Example: [002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)
+        _, _, right = uptime_str.partition(" (")
+        uptime_ms_str, separator, _ = right.partition(" ms")
+        if not separator:
+            raise ParsingError("Could not parse uptime.")
         uptime_ms = int(uptime_ms_str)
         return uptime_ms
 
     def get_system_info(self) -> str:
         """! Gets the system info of the DWM1001."""
-        system_info_str = self.get_command_output(ShellCommand.GET_SYSTEM_INFO.value)
+        system_info_str = self.__get_cached_command_output(ShellCommand.GET_SYSTEM_INFO)
         return system_info_str
 
-    def get_command_output(self, command: ShellCommand) -> str:
-        """! Sends a shell command to the DWM1001 and returns the output.
+    def get_system_info_parsed(self) -> SystemInfo:
+        """! Gets the commonly used system info fields with a single 'si' command.
+        @return SystemInfo: The BLE address and network ID of the DWM1001, each None if
+        missing from the 'si' output."""
+        system_info_str = self.get_system_info()
+        system_info = self.__system_info_cache
+        if system_info is None or system_info.raw is not system_info_str:
+            system_info = self._parse_system_info_str(system_info_str)
+            self.__system_info_cache = system_info
+        return system_info
+
+    def _parse_system_info_str(self, system_info_str: str) -> SystemInfo:
+        # Each field is optional, so a getter only fails on the field it returns
+        ble_match = _BLE_RE.search(system_info_str)
+        panid_match = _PANID_RE.search(system_info_str)
+        return SystemInfo(
+            ble_address=None if ble_match is None else ble_match.group(1),
+            network_id=None if panid_match is None else panid_match.group(1),
+            raw=system_info_str,
+        )
+
+    def __get_cached_command_output(
+        self, command: ShellCommand, ttl_sec: float = __COMMAND_CACHE_TTL_SEC
+    ) -> str:
+        """! Returns the output of a command, reusing a recent result if still fresh.
         @param command (ShellCommand): The shell command to send.
+        @param ttl_sec (float): How long a cached output stays fresh, in seconds.
         @return str: The output of the shell command."""
-        try:
-            self.__pexpect_handle.sendline(command)
-            self.__pexpect_handle.expect(self.__SHELL_PROMPT)
-            command_output = self.__pexpect_handle.before.decode().strip()
-        except pexpect.exceptions.TIMEOUT:
-            self.__log.warning(f"Timeout on command: {command}")
-            raise pexpect.exceptions.TIMEOUT(f"Timeout on command: {command}")
+        now = time.monotonic()
+        cached = self.__command_output_cache.get(command)
+        if cached is not None and now - cached[0] < ttl_sec:
+            return cached[1]
+        command_output = self.get_command_output(command)
+        self.__command_output_cache[command] = (now, command_output)
         return command_output
 
+    def clear_command_cache(self) -> None:
+        """! Discards cached command outputs so the next query goes to the DWM1001."""
+        self.__command_output_cache.clear()
+        self.__system_info_cache = None
+
+    def get_command_output(self, command: Union[ShellCommand, str]) -> str:
+        """! Sends a shell command to the DWM1001 and returns the output.
+        @param command (ShellCommand | str): The shell command to send.
+        @return str: The output of the shell command."""
+        # Strip the bytes first so only the payload is decoded
+        return self._send_and_collect(command).strip().decode(errors="replace")
+
+    def get_command_output_bytes(self, command: Union[ShellCommand, str]) -> bytes:
+        """! Sends a shell command to the DWM1001 and returns the raw, undecoded output.
+        @param command (ShellCommand | str): The shell command to send.
+        @return bytes: The output of the shell command, without the trailing prompt.
+
+        Useful for callers that only search the output with bytes patterns and want to
+        skip decoding large responses (e.g. 'si' or 'la').
+        """
+        return self._send_and_collect(command)
+
+    def get_command_outputs(self, commands: list) -> list:
+        """! Sends several shell commands in one write and returns their outputs.
+        @param commands (list[ShellCommand | str]): The shell commands to send, in order.
+        @return list[str]: The output of each shell command, in the same order.
+
+        All commands are queued in the DWM1001 shell before the first reply is read, so
+        the UART never idles between commands waiting on the host.
+
+        @exception pexpect.exceptions.TIMEOUT: If a shell prompt is not seen in time.
+        @exception ActiveStreamError: If a command stream is open on this node.
+        """
+        self.__check_no_active_stream()
+        command_lines = []
+        for command in commands:
+            command_bytes = _COMMAND_BYTES.get(command)
+            if command_bytes is None:
+                command_bytes = (command + ShellCommand.ENTER.value).encode()
+            command_lines.append(command_bytes)
+        self.__serial_handle.write(b"".join(command_lines))
+        # One deadline for the batch, scaled by the number of replies it waits for
+        outputs = self.__read_prompts(
+            len(commands), self.__shell_timeout_sec * len(commands)
+        )
+        if len(outputs) < len(commands):
+            self.__log.warning("Timeout on commands: %s", commands)
+            raise pexpect.exceptions.TIMEOUT(f"Timeout on commands: {commands}")
+        return [output.strip().decode(errors="replace") for output in outputs]
+
+    def _send_and_collect(self, command: Union[ShellCommand, str]) -> bytes:
+        """! Writes a shell command and reads the response up to the next shell prompt.
+        @param command (ShellCommand | str): The shell command to send.
+        @return bytes: The output of the shell command, without the trailing prompt.
+
+        @exception pexpect.exceptions.TIMEOUT: If the shell prompt is not seen in time.
+        @exception ActiveStreamError: If a command stream is open on this node.
+        """
+        self.__check_no_active_stream()
+        command_bytes = _COMMAND_BYTES.get(command)
+        if command_bytes is None:
+            command_bytes = (command + ShellCommand.ENTER.value).encode()
+        self.__serial_handle.write(command_bytes)
+        return self.__collect_response(command)
+
+    def __check_no_active_stream(self) -> None:
+        """! Raises if a stream has a command in flight, whose reply the next read would take.
+        @exception ActiveStreamError: If a command stream is open on this node."""
+        if self.__active_stream_command is not None:
+            raise ActiveStreamError(
+                f"A '{self.__active_stream_command}' stream is open, close() it first."
+            )
+
+    def __collect_response(self, command: Union[ShellCommand, str]) -> bytes:
+        """! Reads the response to an already written command up to the shell prompt.
+        @param command (ShellCommand | str): The command, for the timeout message.
+        @return bytes: The output of the shell command, without the trailing prompt.
+
+        @exception pexpect.exceptions.TIMEOUT: If the shell prompt is not seen in time.
+        """
+        outputs = self.__read_prompts(1, self.__shell_timeout_sec)
+        if not outputs:
+            self.__log.warning("Timeout on command: %s", command)
+            raise pexpect.exceptions.TIMEOUT(f"Timeout on command: {command}")
+        return outputs[0]
+
+    def __read_prompts(self, count: int, timeout_sec: float) -> list:
+        """! Reads shell output until `count` prompts are seen or the deadline expires.
+        @param count (int): The number of prompt terminated replies to read.
+        @param timeout_sec (float): Deadline for the whole read.
+        @return list[bytes]: The output before each prompt, without the prompt. Shorter
+        than `count` if the deadline expired, in which case partial output is dropped.
+
+        Prompts are counted anywhere in the buffer, so reads need not end on a prompt.
+        Bytes read past the last wanted prompt are kept for the next read.
+        """
+        serial_handle = self.__serial_handle
+        prompt = self.__SHELL_PROMPT_BYTES
+        response = self.__pending_input
+        outputs = []
+        output_start = search_start = 0
+        timeout = Timeout(timeout_sec)
+        while True:
+            prompt_index = response.find(prompt, search_start)
+            if prompt_index >= 0:
+                outputs.append(bytes(response[output_start:prompt_index]))
+                output_start = search_start = prompt_index + len(prompt)
+                if len(outputs) == count:
+                    del response[:output_start]
+                    return outputs
+                continue
+            # A prompt may be split across reads, rescan its possible start
+            search_start = max(output_start, len(response) - len(prompt) + 1)
+            in_waiting = serial_handle.in_waiting
+            if in_waiting:
+                response += serial_handle.read(in_waiting)
+            elif timeout.expired():
+                response.clear()
+                return outputs
+            else:
+                time.sleep(self.__READ_POLL_SEC)
+
+    def __read_until(self, terminators, timeout_sec: float) -> bytearray:
+        """! Reads from the serial handle until a terminator, size limit, or timeout.
+        @param terminators (bytes | tuple[bytes]): Stop once the data ends with one of these.
+        @param timeout_sec (float): Deadline for the whole read.
+        @return bytearray: The data read, including the terminator if one was seen.
+
+        Unlike Serial.read_until, which reads one byte per call, this drains every byte
+        already buffered by the driver on each read. Only bytes already buffered are read,
+        so the deadline holds whatever timeout the caller configured on the handle.
+        """
+        serial_handle = self.__serial_handle
+        response = bytearray()
+        timeout = Timeout(timeout_sec)
+        while len(response) < self.__MAX_RESPONSE_BYTES:
+            in_waiting = serial_handle.in_waiting
+            if in_waiting:
+                response += serial_handle.read(in_waiting)
+                if response.endswith(terminators):
+                    break
+            elif timeout.expired():
+                break
+            else:
+                time.sleep(self.__READ_POLL_SEC)
+        return response
+
     def reset(self) -> None:
         """! Resets (reboots) the DWM1001 device."""
-        self.__pexpect_handle.sendline(ShellCommand.RESET.value)
-        time.sleep(self.__RESET_DELAY_PERIOD)
+        self.clear_command_cache()
+        self.__in_shell_mode = False  # The DWM1001 reboots into binary mode
+        self.__pending_input.clear()
+        self.__serial_handle.write(_COMMAND_BYTES[ShellCommand.RESET])
+        # Return as soon as the rebooted DWM1001 answers a mode probe. A shell prompt can
+        # only come from the shell before the reboot, so only the binary reply counts.
+        timeout = Timeout(self.__RESET_TIMEOUT_SEC)
+        while not timeout.expired():
+            if self.__probe_mode().endswith(self.__BINARY_MODE_RESPONSE):
+                return
+        self.__log.warning("Timeout while waiting for the DWM1001 to reset.")
+
+    def __probe_mode(self) -> bytearray:
+        """! Sends the mode probe and reads until a binary or shell mode reply.
+        @return bytearray: The reply, ending with one of __MODE_PROBE_RESPONSES unless
+        the probe timed out."""
+        self.__pending_input.clear()  # Output of earlier commands is stale now
+        self.__serial_handle.write(("a" + ShellCommand.ENTER.value).encode())
+        return self.__read_until(
+            self.__MODE_PROBE_RESPONSES, self.__MODE_PROBE_TIMEOUT_SEC
+        )
 
     def is_in_shell_mode(self) -> bool:
         """! Checks if the DWM1001 is in shell interface mode."""
-        self.__pexpect_handle.send("a" + ShellCommand.ENTER.value)
-        try:
-            result_index = self.__pexpect_handle.expect(
-                [self.__BINARY_MODE_RESPONSE, self.__SHELL_PROMPT], timeout=1
-            )
-            if result_index == 0:
-                return False
-            elif result_index == 1:
-                return True
-        except pexpect.exceptions.TIMEOUT:
+        response = self.__probe_mode()
+        if response.endswith(self.__SHELL_PROMPT_BYTES):
+            self.__in_shell_mode = True
+            return True
+        self.__in_shell_mode = False
+        if not response.endswith(self.__BINARY_MODE_RESPONSE):
             self.__log.warning("Timeout while checking is in shell mode.")
-            return False
+        return False
 
     def enter_shell_mode(self) -> None:
-        """! Enters the shell interface mode."""
-        if self.is_in_shell_mode():  # Protect if already in shell mode
+        """! Enters the shell interface mode.
+
+        Skips the mode probe when this node already entered or detected shell mode.
+        """
+        # Protect if already in shell mode
+        if self.__in_shell_mode or self.is_in_shell_mode():
             self.__log.debug("Already in shell mode.")
             return
+        self.__send_shell_mode_entry()
+
+    def __send_shell_mode_entry(self) -> None:
+        """! Sends the shell mode entry sequence and waits for the prompt.
 
+        Precondition: the caller has already checked that the DWM1001 is not in shell mode.
+        """
         self.__log.debug("Entering shell mode.")
-        self.__pexpect_handle.send(ShellCommand.DOUBLE_ENTER.value)
-        try:
-            self.__pexpect_handle.expect(self.__SHELL_PROMPT)  # Wait for shell prompt
-        except pexpect.exceptions.TIMEOUT:
+        self.__serial_handle.write(ShellCommand.DOUBLE_ENTER.value.encode())
+        if not self.__read_prompts(1, self.__shell_timeout_sec):
             self.__log.warning("Timeout while entering shell mode.")
             raise pexpect.exceptions.TIMEOUT("Timeout while entering shell mode.")
+        # A device that was already in shell mode (missed probe) answers each enter with a
+        # prompt, the extra one would be read as the reply to the next command
+        self.__drain_input()
+        self.__in_shell_mode = True
         self.__log.debug("Entered shell mode.")
 
+    def __drain_input(self) -> None:
+        """! Discards input until the line stays quiet for the settle time.
+
+        Bounded by the shell timeout, in case the DWM1001 keeps sending.
+        """
+        serial_handle = self.__serial_handle
+        self.__pending_input.clear()
+        timeout = Timeout(self.__shell_timeout_sec)
+        quiet = Timeout(self.__SHELL_ENTRY_SETTLE_SEC)
+        while not timeout.expired():
+            in_waiting = serial_handle.in_waiting
+            if in_waiting:
+                serial_handle.read(in_waiting)
+                quiet.restart(self.__SHELL_ENTRY_SETTLE_SEC)
+            elif quiet.expired():
+                break
+            else:
+                time.sleep(self.__READ_POLL_SEC)
+
     def exit_shell_mode(self) -> None:
         """! Exits the shell interface mode.
 
@@ -162,47 +480,108 @@ class DWM1001Node:
         """! Gets the position of the tag from the DWM1001.
         @return TagPosition: The position of the tag.
         """
-        location_str = self.get_command_output(ShellCommand.GET_POSITION.value)
+        location_str = self.get_command_output(_CMD_APG)
         location = TagPosition.from_string(location_str)
         return location
 
+    def stream_positions(self):
+        """! Yields tag positions continuously, as fast as the DWM1001 answers.
+        @return Iterator[TagPosition]: A generator of tag positions.
+
+        The next 'apg' command is written as soon as a reply arrives, before that reply
+        is parsed and yielded, so parsing and the caller's work overlap with the next
+        UART round trip. Call close() on the generator to stop; the reply to the last
+        in-flight command is drained so the shell stays in sync. Breaking out of a loop
+        does not close a generator that is still bound to a name.
+
+        While the stream is open, other commands on this node raise ActiveStreamError.
+
+        @exception ActiveStreamError: If another stream is already open on this node.
+
+        Example usage:
+          - with contextlib.closing(dwm1001node.stream_positions()) as positions:
+          -     for position in positions: ...
+        """
+        return self.__stream_command(_CMD_APG, TagPosition.from_string)
+
+    def stream_accelerometer(self):
+        """! Yields accelerometer samples continuously, as fast as the DWM1001 answers.
+        @return Iterator[AccelerometerData]: A generator of accelerometer samples.
+
+        Pipelines 'av' commands the same way as stream_positions(). Call close() on the
+        generator to stop; while it is open, other commands on this node raise
+        ActiveStreamError.
+
+        @exception ActiveStreamError: If another stream is already open on this node.
+
+        Example usage:
+          - with contextlib.closing(dwm1001node.stream_accelerometer()) as samples:
+          -     for sample in samples: ...
+        """
+        return self.__stream_command(_CMD_AV, self._parse_accelerometer_str)
+
+    def __stream_command(self, command: str, parse):
+        """! Repeats a shell command, writing each command before parsing the last reply.
+        @param command (str): The shell command to repeat.
+        @param parse (Callable[[str], Any]): Parses one command output.
+        @return Iterator: A generator of parsed command outputs."""
+        self.__check_no_active_stream()
+        command_bytes = _COMMAND_BYTES[command]
+        self.__serial_handle.write(command_bytes)
+        self.__active_stream_command = command
+        in_flight = True
+        try:
+            while True:
+                response = self.__collect_response(command)
+                self.__serial_handle.write(command_bytes)
+                yield parse(response.strip().decode(errors="replace"))
+        except pexpect.exceptions.TIMEOUT:
+            in_flight = False
+            raise
+        finally:
+            if in_flight:
+                self.__read_prompts(1, self.__shell_timeout_sec)
+            self.__active_stream_command = None
+
     def get_ble_address(self) -> str:
         """! Gets the Bluetooth Low Energy (BLE) address of the DWM1001.
         @return str: The BLE hardware/MAC address of the DWM1001.
         """
-        system_info_str = self.get_system_info()
-        return self._parse_ble_address(system_info_str)
+        # The BLE address never changes until reset, which clears the cache
+        system_info = self.__system_info_cache or self.get_system_info_parsed()
+        if system_info.ble_address is None:
+            raise ParsingError("Could not parse BLE address.")
+        return system_info.ble_address
 
     def _parse_ble_address(self, system_info_str: str) -> str:
         # Example line: [036167.350 INF] ble: addr=E0:E5:D3:0A:19:BE
         # Example line: [036967.750 INF] ble: addr=E0:D5:F3:FA:19:C1
-        pattern = r"ble: addr=(?P<ble_address>[0-9A-F:]+)"
-        match = re.search(pattern, system_info_str)
+        match = _BLE_RE.search(system_info_str)
         if match is None:
             raise ParsingError("Could not parse BLE address.")
-        return match.group("ble_address")
+        return match.group(1)
 
     def get_network_id(self) -> str:
         """! Gets the network ID (the hex name) the DWM1001 is associated with.
         @return str: The network ID of the DWM1001."""
-        system_info_str = self.get_system_info()
-        return self._parse_network_id(system_info_str)
+        # The network ID never changes until reset, which clears the cache
+        system_info = self.__system_info_cache or self.get_system_info_parsed()
+        if system_info.network_id is None:
+            raise ParsingError("Could not parse network ID.")
+        return system_info.network_id
 
     def _parse_network_id(self, system_info_str: str) -> str:
         # Example line: [036167.320 INF] uwb0: panid=xC7D4 addr=xDECA59CDFA608830
-        pattern = r"panid=(?P<network_id>x[0-9A-F]+) addr="
-        match = re.search(pattern, system_info_str)
+        match = _PANID_RE.search(system_info_str)
         if match is None:
             raise ParsingError("Could not parse network ID.")
-        return match.group("network_id")
+        return match.group(1)
 
     def get_accelerometer_data(self) -> AccelerometerData:
         """! Gets a sample of the accelerometer data from the DWM1001.
         @return AccelerometerData: The accelerometer data with x,y,z values.
         """
-        accelerometer_str = self.get_command_output(
-            ShellCommand.GET_ACCELEROMETER.value
-        )
+        accelerometer_str = self.get_command_output(_CMD_AV)
         return self._parse_accelerometer_str(accelerometer_str)
 
     def _parse_accelerometer_str(self, accelerometer_str: str) -> AccelerometerData:
@@ -210,15 +589,11 @@ class DWM1001Node:
         @param accelerometer_str (str): The output of the 'accelerometer' command.
         @return AccelerometerData: The accelerometer data with x,y,z values."""
         # Example line: acc: x = -256, y = 1424, z = 8032
-        pattern = r"acc: x = (?P<x>-?\d+), y = (?P<y>-?\d+), z = (?P<z>-?\d+)"
-        match = re.search(pattern, accelerometer_str)
+        match = _ACC_RE.search(accelerometer_str)
         if match is None:
             raise ParsingError("Could not parse accelerometer data.")
-        return AccelerometerData(
-            x_raw=int(match.group("x")),
-            y_raw=int(match.group("y")),
-            z_raw=int(match.group("z")),
-        )
+        x_str, y_str, z_str = match.groups()
+        return AccelerometerData(x_raw=int(x_str), y_raw=int(y_str), z_raw=int(z_str))
 
     def get_node_mode_str(self) -> str:
         """! Gets the node mode of the DWM1001.
@@ -230,26 +605,25 @@ class DWM1001Node:
         - Example anchor:                 "mode: an (act,-,-)"
         - Example anchor in initiating:   "mode: ani (act,-,-)"
         """
-        node_mode_str = self.get_command_output(ShellCommand.GET_MODE.value)
+        node_mode_str = self.__get_cached_command_output(
+            ShellCommand.GET_MODE, self.__NODE_MODE_CACHE_TTL_SEC
+        )
         return node_mode_str
 
     def is_in_tag_mode(self) -> bool:
         """! Checks if the DWM1001 node is in tag mode.
         @return bool: True if the node is in tag mode, False otherwise."""
-        node_mode_str = self.get_node_mode_str()
-        return self._parse_node_mode_str(node_mode_str) == NodeMode.TAG
+        return self.get_node_mode() is NodeMode.TAG
 
     def is_in_anchor_mode(self) -> bool:
         """! Checks if the DWM1001 node is in anchor mode.
         @return bool: True if the node is in anchor mode, False otherwise."""
-        node_mode_str = self.get_node_mode_str()
-        return self._parse_node_mode_str(node_mode_str) == NodeMode.ANCHOR
+        return self.get_node_mode() is NodeMode.ANCHOR
 
     def is_in_anchor_initiator_mode(self) -> bool:
         """! Checks if the DWM1001 node is in anchor initiator mode.
         @return bool: True if the node is in anchor initiator mode, False otherwise."""
-        node_mode_str = self.get_node_mode_str()
-        return self._parse_node_mode_str(node_mode_str) == NodeMode.ANCHOR_INITIATOR
+        return self.get_node_mode() is NodeMode.ANCHOR_INITIATOR
 
     def get_node_mode(self) -> NodeMode:
         """! Gets the node mode of the DWM1001.
@@ -263,22 +637,15 @@ class DWM1001Node:
         # Example: mode: tn (off,twr,np,le)
         # Example: mode: an (act,-,-)
         # Example: mode: ani (act,-,-)
-        if "mode: tn (" in node_mode_str:
-            return NodeMode.TAG
-        elif "mode: an (" in node_mode_str:
-            return NodeMode.ANCHOR
-        elif "mode: ani (" in node_mode_str:
-            return NodeMode.ANCHOR_INITIATOR
-
-    def get_gpio_pin_state(self, pin: int) -> bool:
-        """! Gets the state of a GPIO pin on the DWM1001.
-        @param pin (int): The GPIO pin number (0-31).
-        @return bool: True if the pin is high, False if the pin is low.
-
-        Valid pin numbers are: [2, 8, 9, 10, 12, 13, 14, 15, 23, 27]
-        """
-        pin_state_str = self.get_command_output(f"{ShellCommand.GPIO_GET.value} {pin}")
-        return self._parse_gpio_pin_state_str(pin_state_str)
+        mode_start = node_mode_str.find("mode: ")
+        token_start = mode_start + len("mode: ")
+        token_end = node_mode_str.find(" (", token_start)
+        if mode_start < 0 or token_end < 0:
+            raise ParsingError("Could not parse node mode.")
+        try:
+            return _NODE_MODE_TOKENS[node_mode_str[token_start:token_end]]
+        except KeyError:
+            raise ParsingError("Could not parse node mode.")
 
     def get_gpio_pin_state(self, pin: int) -> bool:
         """! Gets the state of a GPIO pin on the DWM1001.
@@ -287,7 +654,8 @@ class DWM1001Node:
 
         Valid pin numbers are: [2, 8, 9, 10, 12, 13, 14, 15, 23, 27]
         """
-        pin_state_str = self.get_command_output(f"{ShellCommand.GPIO_GET.value} {pin}")
+        self.__check_gpio_pin(pin)
+        pin_state_str = self.get_command_output(f"{_CMD_GG} {pin}")
         if "reserved" in pin_state_str:
             raise ReservedGPIOPinError(f"GPIO pin {pin} is reserved by the DWM1001.")
         return self._parse_gpio_pin_state_str(pin_state_str)
@@ -300,23 +668,24 @@ class DWM1001Node:
         # Example: gpio2: 1
         # Example: gpio14: 0
         # Example: gpio14: 1
-        pattern = r"gpio\d+: (?P<state>\d)"
-        match = re.search(pattern, pin_state_str)
-        if match is None:
+        head, separator, state = pin_state_str.rstrip().rpartition(": ")
+        if not separator or "gpio" not in head or state not in ("0", "1"):
             raise ParsingError("Could not parse GPIO pin state.")
-        return bool(int(match.group("state")))
+        return state == "1"
 
     def set_gpio_pin_high(self, pin: int) -> None:
         """! Sets a GPIO pin on the DWM1001 to HIGH.
         @param pin (int): The GPIO pin number (0-31)."""
-        result_str = self.get_command_output(f"{ShellCommand.GPIO_SET.value} {pin}")
+        self.__check_gpio_pin(pin)
+        result_str = self.get_command_output(f"{_CMD_GS} {pin}")
         if "reserved" in result_str:
             raise ReservedGPIOPinError(f"GPIO pin {pin} is reserved by the DWM1001.")
 
     def set_gpio_pin_low(self, pin: int) -> None:
         """! Sets a GPIO pin on the DWM1001 to LOW.
         @param pin (int): The GPIO pin number (0-31)."""
-        result_str = self.get_command_output(f"{ShellCommand.GPIO_CLEAR.value} {pin}")
+        self.__check_gpio_pin(pin)
+        result_str = self.get_command_output(f"{_CMD_GC} {pin}")
         if "reserved" in result_str:
             raise ReservedGPIOPinError(f"GPIO pin {pin} is reserved by the DWM1001.")
 
@@ -337,13 +706,18 @@ class DWM1001Node:
 
         Valid pin numbers are: [2, 8, 9, 10, 12, 13, 14, 15, 23, 27]
         """
-        return pin in [2, 8, 9, 10, 12, 13, 14, 15, 23, 27]
+        return pin in self.__VALID_GPIO_PINS
+
+    def __check_gpio_pin(self, pin: int) -> None:
+        """! Raises ReservedGPIOPinError for reserved pins without a UART round-trip."""
+        if pin not in self.__VALID_GPIO_PINS:
+            raise ReservedGPIOPinError(f"GPIO pin {pin} is reserved by the DWM1001.")
 
     def get_list_of_anchors(self) -> list:
         """! Gets a list of anchors currently seen by the DWM1001.
         @return list[AnchorNodeData]: A list of AnchorNodeData instances.
         """
-        anchor_list_str = self.get_command_output(ShellCommand.GET_ANCHOR_LIST.value)
+        anchor_list_str = self.get_command_output(_CMD_LA)
         return self._parse_anchor_list_str(anchor_list_str)
 
     def _parse_anchor_list_str(self, anchor_list_str: str) -> list:
@@ -351,12 +725,17 @@ class DWM1001Node:
         @param anchor_list_str (str): The output of the 'list anchors' command.
         @return list[AnchorNodeData]: A list of AnchorNodeData instances.
         """
-        lines = anchor_list_str.splitlines()
-        anchor_list = []
-        for line in lines:
-            if " seat=" in line:
-                anchor_list.append(AnchorNodeData.from_string(line))
-        return anchor_list
+        return AnchorNodeData.list_from_string(anchor_list_str)
+
+    def get_anchor_table(self) -> tuple:
+        """! Gets the anchors currently seen by the DWM1001, one sequence per field.
+        @return tuple[tuple, ...]: The ids, seats, seens, x, y and z values of every anchor.
+
+        Lets distance or trilateration code build position arrays in one step, e.g.
+        numpy.column_stack(table[3:]), without looping over AnchorNodeData instances.
+        """
+        anchor_list_str = self.get_command_output(_CMD_LA)
+        return AnchorNodeData.table_from_string(anchor_list_str)
 
     def get_anchors_seen_count(self) -> int:
         """! Gets the number of anchors currently seen by the DWM1001.
@@ -364,7 +743,7 @@ class DWM1001Node:
         """
         # Example: [005899.170 INF] AN: cnt=4 seq=x09
         # Example: [005899.170 INF] AN: cnt=2 seq=x03
-        anchor_list_str = self.get_command_output(ShellCommand.GET_ANCHOR_LIST.value)
+        anchor_list_str = self.get_command_output(_CMD_LA)
         return self._parse_anchors_seen_count_str(anchor_list_str)
 
     def _parse_anchors_seen_count_str(self, anchor_list_str: str) -> int:
@@ -374,8 +753,25 @@ class DWM1001Node:
         """
         # Example: [005899.170 INF] AN: cnt=4 seq=x09
         # Example: [005899.170 INF] AN: cnt=2 seq=x03
-        pattern = r"AN: cnt=(?P<cnt>\d+) seq="
-        match = re.search(pattern, anchor_list_str)
+        match = _AN_CNT_RE.search(anchor_list_str)
         if match is None:
             raise ParsingError("Could not parse anchor list.")
-        return int(match.group("cnt"))
+        return int(match.group(1))
+
+
+def poll_many(nodes: list, function) -> list:
+    """! Runs a query on several DWM1001 nodes concurrently, one thread per node.
+    @param nodes (list[DWM1001Node]): The nodes to query, each on its own serial port.
+    @param function (Callable[[DWM1001Node], Any]): The query, e.g. DWM1001Node.get_position.
+    @return list: The results, in the same order as nodes.
+
+    Each node has its own UART and pyserial releases the GIL while waiting on it, so
+    polling M nodes takes about one round trip instead of M.
+
+    Example usage:
+      - positions = poll_many([tag_a, tag_b], DWM1001Node.get_position)
+    """
+    if not nodes:
+        return []
+    with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+        return list(executor.map(function, nodes))
@@ -9,3 +9,9 @@ class ReservedGPIOPinError(Exception):
     """! Exception raised when trying to use a reserved GPIO pin."""
 
     pass
+
+
+class ActiveStreamError(Exception):
+    """! Exception raised when sending a shell command while a command stream is open."""
+
+    pass
@@ -0,0 +1,23 @@
+from dataclasses import fields
+
+
+class FrozenSlots:
+    """! Copy and pickle support for frozen dataclasses that declare __slots__.
+
+    The default slot state restore assigns each attribute with setattr, which a frozen
+    dataclass rejects with FrozenInstanceError. This is the same pair of state methods
+    dataclass(slots=True) adds on Python 3.10+, for the Python 3.7+ this package supports.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> tuple:
+        """! Gets the field values for copy and pickle.
+        @return tuple: The values of every dataclass field, in declaration order."""
+        return tuple([getattr(self, field.name) for field in fields(self)])
+
+    def __setstate__(self, state: tuple) -> None:
+        """! Restores the field values from copy and pickle, bypassing the frozen check.
+        @param state (tuple): The field values from __getstate__."""
+        for field, value in zip(fields(self), state):
+            object.__setattr__(self, field.name, value)
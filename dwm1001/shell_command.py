@@ -16,3 +16,7 @@ class ShellCommand(Enum):
     GPIO_CLEAR = "gc"  # Set GPIO pin LOW
     GPIO_SET = "gs"  # Set GPIO pin HIGH
     GPIO_GET = "gg"  # Get GPIO pin value
+
+    def __init__(self, value: str) -> None:
+        # The command line as written to the serial port, encoded once at import
+        self.line_bytes = (value + "\r").encode()
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# Module imports
+from .frozen_slots import FrozenSlots
+
+
+@dataclass(frozen=True)
+class SystemInfo(FrozenSlots):
+    """! Represents the commonly used fields of the DWM1001 system info ('si') output.
+
+    Attributes:
+    - ble_address (str | None): The BLE hardware/MAC address, e.g. "E0:E5:D3:0A:19:BE".
+    - network_id (str | None): The UWB network ID (panid), e.g. "xC7D4".
+    - raw (str): The full 'si' command output the fields were parsed from.
+
+    A field is None when its line is missing from the 'si' output.
+
+    """
+
+    __slots__ = ("ble_address", "network_id", "raw")
+
+    ble_address: Optional[str]
+    network_id: Optional[str]
+    raw: str
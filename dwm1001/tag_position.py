@@ -1,13 +1,15 @@
 from dataclasses import dataclass
-import math
 import re
 
 # Module imports
+from dwm1001.frozen_slots import FrozenSlots
 from dwm1001.exceptions import ParsingError
 
+_APG_RE = re.compile(r"x:(-?\d+) y:(-?\d+) z:(-?\d+) qf:(\d+)")
 
-@dataclass
-class TagPosition:
+
+@dataclass(frozen=True)
+class TagPosition(FrozenSlots):
     """! Represents the position of a tag in 3D space.
 
     Attributes:
@@ -16,8 +18,11 @@ class TagPosition:
     - z_m (float): Z-coordinate in meters.
     - quality (int): Quality of the tag position.
 
+    Instances are immutable and slotted (no per-instance __dict__).
     """
 
+    __slots__ = ("x_m", "y_m", "z_m", "quality")
+
     x_m: float
     y_m: float
     z_m: float
@@ -31,10 +36,14 @@ class TagPosition:
 
         @return bool: True if the instances are almost equal, False otherwise.
         """
+        # Same test as math.isclose(a, b, rel_tol=tolerance) with abs_tol=0, inlined
+        tolerance = relative_tolerance_m
+        ax, ay, az = self.x_m, self.y_m, self.z_m
+        bx, by, bz = other.x_m, other.y_m, other.z_m
         return (
-            math.isclose(self.x_m, other.x_m, rel_tol=relative_tolerance_m)
-            and math.isclose(self.y_m, other.y_m, rel_tol=relative_tolerance_m)
-            and math.isclose(self.z_m, other.z_m, rel_tol=relative_tolerance_m)
+            abs(ax - bx) <= tolerance * max(abs(ax), abs(bx))
+            and abs(ay - by) <= tolerance * max(abs(ay), abs(by))
+            and abs(az - bz) <= tolerance * max(abs(az), abs(bz))
         )
 
     def __eq__(self, other: "TagPosition") -> bool:
@@ -44,8 +53,17 @@ class TagPosition:
 
         @return bool: True if the instances are equal, False otherwise.
         """
+        if other is self:
+            return True
+        if not isinstance(other, TagPosition):
+            return NotImplemented
+        # Chained comparisons short-circuit and measured faster than comparing tuples
         return self.x_m == other.x_m and self.y_m == other.y_m and self.z_m == other.z_m
 
+    def __hash__(self) -> int:
+        """! Hashes the coordinates, consistent with __eq__ ignoring quality."""
+        return hash((self.x_m, self.y_m, self.z_m))
+
     @staticmethod
     def from_string(apg_line: str) -> "TagPosition":
         """! Parses a string to create a TagPosition instance.
@@ -62,19 +80,45 @@ class TagPosition:
         # Example line: x:0 y:0 z:0 qf:0
         # Example line: x:10 y:78888 z:-334 qf:57
         # Note: apg command returns values in mm, so we divide by 1000
-        pattern = r"x:(?P<x>-?\d+) y:(?P<y>-?\d+) z:(?P<z>-?\d+) qf:(?P<qf>\d+)"
-        match = re.search(pattern, apg_line)
+        # int / int is correctly rounded, unlike int * 0.001 which is off by 1 ULP
+        # for some values (e.g. 9 * 0.001 != 0.009)
+        # The precompiled regex measured faster than str.split + prefix checks here
+        match = _APG_RE.search(apg_line)
         if match is None:
             raise ParsingError("Could not parse APG line.")
+        x_str, y_str, z_str, quality_str = match.groups()
         position = TagPosition(
-            x_m=float(match.group("x")) / 1000,
-            y_m=float(match.group("y")) / 1000,
-            z_m=float(match.group("z")) / 1000,
-            quality=int(match.group("qf")),
+            x_m=int(x_str) / 1000,
+            y_m=int(y_str) / 1000,
+            z_m=int(z_str) / 1000,
+            quality=int(quality_str),
         )
 
         return position
 
+    @staticmethod
+    def from_strings_batch(apg_lines: list) -> tuple:
+        """! Parses many APG lines at once into per-axis sequences.
+
+        @param apg_lines (list[str]): The APG lines, e.g. from a log of positions.
+
+        @return tuple[tuple, tuple, tuple, tuple]: The x_m, y_m, z_m and quality values
+        of every parsed line, one tuple per field (e.g. ready for numpy.array()).
+
+        Lines that do not contain an APG position are skipped.
+        """
+        # One regex pass over the joined buffer instead of one search per line
+        samples = _APG_RE.findall("\n".join(apg_lines))
+        if not samples:
+            return ((), (), (), ())
+        x_strs, y_strs, z_strs, quality_strs = zip(*samples)
+        return (
+            tuple([int(x_str) / 1000 for x_str in x_strs]),
+            tuple([int(y_str) / 1000 for y_str in y_strs]),
+            tuple([int(z_str) / 1000 for z_str in z_strs]),
+            tuple(map(int, quality_strs)),
+        )
+
     def get_as_tuple(self) -> tuple:
         """! Gets the position as a tuple of floats.
         @return tuple[float, float, float]: The position as a tuple of floats.
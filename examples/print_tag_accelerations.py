@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
 # Standard library imports
+from contextlib import closing
 from pathlib import Path
 import sys
 from typing import NoReturn
-from time import sleep
 import logging
 
 # Third party imports
@@ -29,9 +29,11 @@ def main() -> NoReturn:
     print("Connected, printing acceleration, press Ctrl+C to stop")
 
     try:
-        while True:
-            print(node.get_accelerometer_data())
-            sleep(0.25)
+        # Samples arrive as fast as the node answers, no per-sample command turnaround.
+        # Closing the stream drains its in-flight reply before disconnect() resets.
+        with closing(node.stream_accelerometer()) as accelerometer_samples:
+            for accelerometer_data in accelerometer_samples:
+                print(accelerometer_data)
     except KeyboardInterrupt:
         print("Caught keyboard interrupt - stopping")
 
@@ -0,0 +1,39 @@
+import os
+import sys
+import pytest
+from unittest import mock
+from serial import Serial
+from mock_serial import MockSerial
+
+# Add module directory to path, once for every test module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dwm1001.dwm1001 import DWM1001Node
+
+
+@pytest.fixture
+def mock_device():
+    """! Opens mock serial devices for a test, each with a Serial handle to its port.
+
+    Returns a function giving a new (MockSerial, Serial) pair; both are closed in teardown.
+    """
+    devices = []
+
+    def open_device():
+        device = MockSerial()
+        device.open()
+        serial = Serial(device.port)
+        devices.append((device, serial))
+        return device, serial
+
+    yield open_device
+    for device, serial in devices:
+        serial.close()
+        device.close()
+
+
+@pytest.fixture
+def short_reset_timeout():
+    """! Shortens the reset wait, for mock devices that never give the binary mode reply."""
+    with mock.patch.object(DWM1001Node, "_DWM1001Node__RESET_TIMEOUT_SEC", 0.3):
+        yield
@@ -1,12 +1,7 @@
-import os
-import sys
 import pytest
 from unittest import mock
 from serial import Serial
 
-# Add module directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 # Import modules under test
 from dwm1001.dwm1001 import DWM1001Node, AnchorNodeData, TagPosition, ParsingError
 
@@ -29,6 +24,7 @@ list_anchors_str_0 = """[005899.170 INF] AN: cnt=0 seq=x09"""
 list_anchors_str_4 = """[005899.170 INF] AN: cnt=4 seq=xA9"""
 list_anchors_str_13 = """[005899.170 INF] AN: cnt=13 seq=x06"""
 
+
 # ************************* Begin Tests ************************* #
 def test_anchor_node_constructor_0():
     anchor_node = AnchorNodeData.from_string(anchor_data_0)
@@ -74,6 +70,37 @@ def test_list_anchors_command_0():
     assert len(anchor_list) == 0
 
 
+def test_anchor_table_from_string():
+    ids, seats, seens, x, y, z = AnchorNodeData.table_from_string(list_anchors_str)
+
+    assert ids == (
+        "000000000000C920",
+        "0000000000008389",
+        "0000000000000E0B",
+        "0000000000004505",
+    )
+    assert seats == (0, 3, 4, 1)
+    assert seens == (75, 42, 32, 196)
+    assert x == (0.38, 4.96, 0.64, 5.14)
+    assert y == (0.84, 2.50, 8.63, 9.03)
+    assert z == (2.15, 1.78, 1.13, 1.35)
+
+
+def test_get_anchor_table():
+    dwm1001node = DWM1001Node(mock_serial)
+    with mock.patch.object(
+        dwm1001node, "get_command_output", return_value=list_anchors_str
+    ):
+        ids, _, _, x, y, z = dwm1001node.get_anchor_table()
+
+    assert len(ids) == 4
+    assert (x[1], y[1], z[1]) == (4.96, 2.50, 1.78)
+
+
+def test_anchor_table_from_string_0():
+    assert AnchorNodeData.table_from_string(list_anchors_str_0) == ((),) * 6
+
+
 def test_get_seen_anchor_count_0():
     expected_anchor_count = 0
     dwm1001node = DWM1001Node(mock_serial)
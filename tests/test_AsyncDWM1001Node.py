@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from serial import Serial
+from mock_serial import MockSerial
+
+# Import modules under test
+from dwm1001.dwm1001 import DWM1001Node, TagPosition
+from dwm1001.async_dwm1001 import AsyncDWM1001Node
+from dwm1001.shell_command import ShellCommand
+
+
+# ********************* DWM1001 Node in shell mode ********************* #
+@pytest.fixture(scope="module")
+def device():
+    device = MockSerial()
+    device.open()
+    device.stub(
+        name="uptime_command",
+        receive_bytes=ShellCommand.GET_UPTIME.line_bytes,
+        send_bytes=b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> ",
+    )
+    device.stub(
+        name="position_command",
+        receive_bytes=ShellCommand.GET_POSITION.line_bytes,
+        send_bytes=b"apg\r\nx:10 y:78888 z:-334 qf:57\r\ndwm> ",
+    )
+    device.stub(
+        name="system_info_command",
+        receive_bytes=ShellCommand.GET_SYSTEM_INFO.line_bytes,
+        send_bytes=(
+            b"si\r\n[036167.320 INF] uwb0: panid=xC7D4 addr=xDECA59CDFA608830"
+            b"\r\n[036167.350 INF] ble: addr=E0:E5:D3:0A:19:BE\r\ndwm> "
+        ),
+    )
+    device.stub(
+        name="reset_command",
+        receive_bytes=ShellCommand.RESET.line_bytes,
+        send_bytes=b"",
+    )
+    device.stub(
+        name="is_in_shell_mode_check",
+        receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
+        send_bytes=b"dwm> ",
+    )
+    yield device
+    device.close()
+
+
+@pytest.fixture
+def serial(device):
+    serial = Serial(device.port)
+    yield serial
+    serial.close()
+
+
+# ************************* Begin Tests ************************* #
+def test_get_uptime_ms(serial):
+    async def query():
+        async with AsyncDWM1001Node(DWM1001Node(serial)) as node:
+            return await node.get_uptime_ms()
+
+    assert asyncio.run(query()) == 2673760
+
+
+def test_gather_commands(serial):
+    async def query():
+        async with AsyncDWM1001Node(DWM1001Node(serial)) as node:
+            return await asyncio.gather(
+                node.get_uptime_ms(), node.get_position(), node.get_uptime_ms()
+            )
+
+    uptime_ms, position, uptime_ms_again = asyncio.run(query())
+    assert uptime_ms == 2673760
+    assert position == TagPosition(0.010, 78.888, -0.334, 57)
+    assert uptime_ms_again == 2673760
+
+
+def test_system_info(serial):
+    async def query():
+        async with AsyncDWM1001Node(DWM1001Node(serial)) as node:
+            return (
+                await node.get_system_info(),
+                await node.get_system_info_parsed(),
+                await node.get_ble_address(),
+                await node.get_network_id(),
+            )
+
+    system_info_str, system_info, ble_address, network_id = asyncio.run(query())
+    assert isinstance(system_info_str, str)
+    assert system_info.raw == system_info_str
+    assert system_info.ble_address == ble_address == "E0:E5:D3:0A:19:BE"
+    assert system_info.network_id == network_id == "xC7D4"
+
+
+def test_reconnect_after_disconnect_and_close(serial, short_reset_timeout):
+    async def query():
+        node = AsyncDWM1001Node(DWM1001Node(serial))
+        try:
+            await node.connect()
+            await node.disconnect()
+            await node.connect()
+            uptime_ms = await node.get_uptime_ms()
+            await node.disconnect()
+            await node.close()
+            # A closed node starts a new worker when used again
+            return uptime_ms, await node.get_uptime_ms()
+        finally:
+            await node.close()
+
+    assert asyncio.run(query()) == (2673760, 2673760)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,15 +1,9 @@
-import os
-import sys
 import pytest
 import serial
 from unittest import mock
 
-# Add module directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 # Import modules under test
-from dwm1001.dwm1001 import DWM1001Node, AccelerometerData, NodeMode
-
+from dwm1001.dwm1001 import DWM1001Node, AccelerometerData, NodeMode, ParsingError
 
 # ************************* Mock Serial ************************* #
 mock_serial = mock.Mock(serial.Serial)
@@ -47,6 +41,7 @@ system_info_str = """
 [036167.350 INF] ble: addr=E0:E5:D3:0A:19:BE
 """
 
+
 # ************************* Begin Tests ************************* #
 def test_dwm1001_get_uptime_ms():
     expected_uptime_ms = 2673760
@@ -72,6 +67,13 @@ def test_dwm1001_get_uptime_ms_small():
     assert actual_uptime_ms == expected_uptime_ms
 
 
+def test_dwm1001_get_uptime_ms_invalid():
+    dwm1001 = DWM1001Node(mock_serial)
+
+    with pytest.raises(ParsingError):
+        dwm1001._parse_uptime_str("invalid string")
+
+
 def test_parse_get_ble_address():
     expected_ble_address = "E0:E5:D3:0A:19:BE"
     ble_address_return_str = f"si\r\n{system_info_str}\r\ndwm> "
@@ -92,6 +94,60 @@ def test_parse_network_id():
     assert actual_network_id == expected_network_id
 
 
+def test_parse_system_info_str():
+    system_info_return_str = f"si\r\n{system_info_str}\r\ndwm> "
+
+    dwm1001 = DWM1001Node(mock_serial)
+
+    actual_system_info = dwm1001._parse_system_info_str(system_info_return_str)
+    assert actual_system_info.ble_address == "E0:E5:D3:0A:19:BE"
+    assert actual_system_info.network_id == "xC7D4"
+    assert actual_system_info.raw == system_info_return_str
+
+
+def test_ble_address_and_network_id_share_one_query():
+    dwm1001 = DWM1001Node(mock_serial)
+
+    with mock.patch.object(
+        dwm1001, "get_command_output", return_value=f"si\r\n{system_info_str}"
+    ) as get_command_output:
+        assert dwm1001.get_ble_address() == "E0:E5:D3:0A:19:BE"
+        assert dwm1001.get_network_id() == "xC7D4"
+        get_command_output.assert_called_once()
+
+        dwm1001.clear_command_cache()
+        dwm1001.get_network_id()
+        assert get_command_output.call_count == 2
+
+
+def test_ble_address_without_network_id():
+    ble_only_system_info_str = "si\r\n[036167.350 INF] ble: addr=E0:E5:D3:0A:19:BE"
+
+    dwm1001 = DWM1001Node(mock_serial)
+
+    with mock.patch.object(
+        dwm1001, "get_command_output", return_value=ble_only_system_info_str
+    ):
+        assert dwm1001.get_ble_address() == "E0:E5:D3:0A:19:BE"
+        with pytest.raises(ParsingError):
+            dwm1001.get_network_id()
+
+
+def test_network_id_without_ble_address():
+    panid_only_system_info_str = (
+        "si\r\n[036167.320 INF] uwb0: panid=xC7D4 addr=xDECA59CDFA608830"
+    )
+
+    dwm1001 = DWM1001Node(mock_serial)
+
+    with mock.patch.object(
+        dwm1001, "get_command_output", return_value=panid_only_system_info_str
+    ):
+        assert dwm1001.get_network_id() == "xC7D4"
+        with pytest.raises(ParsingError):
+            dwm1001.get_ble_address()
+
+
 def test_parse_accelerometer_str():
     expected_accelerometer_data = AccelerometerData(x_raw=-256, y_raw=1424, z_raw=8032)
     accelerometer_return_str = "av\r\nacc: x = -256, y = 1424, z = 8032\r\ndwm> "
@@ -118,6 +174,15 @@ def test_parse_accelerometer_str_highvals():
     assert actual_accelerometer_data == expected_accelerometer_data
 
 
+def test_accelerometer_data_mps2():
+    # At rest and level: 1 g on z is 250 digits of 4 mg, left-justified by 2^6
+    accelerometer_data = AccelerometerData(x_raw=0, y_raw=-16000, z_raw=16000)
+
+    assert accelerometer_data.x_mps2 == 0.0
+    assert accelerometer_data.y_mps2 == pytest.approx(-9.80665)
+    assert accelerometer_data.z_mps2 == pytest.approx(9.80665)
+
+
 def test_parse_node_mode_tag_active():
     expected_node_mode = NodeMode.TAG
     node_mode_return_str = "nmg\r\nmode: tn (act,twr,np,le)\r\ndwm> "
@@ -148,5 +213,47 @@ def test_parse_node_mode_tag_off():
     assert actual_node_mode == expected_node_mode
 
 
+def test_parse_node_mode_anchor():
+    expected_node_mode = NodeMode.ANCHOR
+    node_mode_return_str = "nmg\r\nmode: an (act,-,-)\r\ndwm> "
+
+    dwm1001 = DWM1001Node(mock_serial)
+
+    actual_node_mode = dwm1001._parse_node_mode_str(node_mode_return_str)
+    assert actual_node_mode == expected_node_mode
+
+
+def test_parse_node_mode_anchor_initiator():
+    expected_node_mode = NodeMode.ANCHOR_INITIATOR
+    node_mode_return_str = "nmg\r\nmode: ani (act,-,-)\r\ndwm> "
+
+    dwm1001 = DWM1001Node(mock_serial)
+
+    actual_node_mode = dwm1001._parse_node_mode_str(node_mode_return_str)
+    assert actual_node_mode == expected_node_mode
+
+
+def test_parse_node_mode_invalid():
+    dwm1001 = DWM1001Node(mock_serial)
+
+    with pytest.raises(ParsingError):
+        dwm1001._parse_node_mode_str("nmg\r\nmode: xx (act,-,-)\r\ndwm> ")
+    with pytest.raises(ParsingError):
+        dwm1001._parse_node_mode_str("invalid string")
+
+
+def test_node_mode_helpers_share_one_query():
+    dwm1001 = DWM1001Node(mock_serial)
+
+    with mock.patch.object(
+        dwm1001, "get_command_output", return_value="nmg\r\nmode: an (act,-,-)"
+    ) as get_command_output:
+        assert not dwm1001.is_in_tag_mode()
+        assert dwm1001.is_in_anchor_mode()
+        assert not dwm1001.is_in_anchor_initiator_mode()
+
+    get_command_output.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,39 @@
+import copy
+import pickle
+import pytest
+
+# Import modules under test
+from dwm1001.dwm1001 import TagPosition, AccelerometerData, AnchorNodeData
+from dwm1001.system_info import SystemInfo
+
+frozen_slotted_instances = [
+    TagPosition(1.23, 4.56, 7.89, 42),
+    AccelerometerData(x_raw=-256, y_raw=1424, z_raw=8032),
+    AnchorNodeData(
+        id="000000000000C920",
+        seat=0,
+        seens=40,
+        position=TagPosition(0.38, 0.84, 2.15, 100),
+    ),
+    SystemInfo(ble_address="E0:E5:D3:0A:19:BE", network_id="xC7D4", raw="si"),
+]
+
+
+# ************************* Begin Tests ************************* #
+@pytest.mark.parametrize(
+    "duplicate",
+    [copy.copy, copy.deepcopy, lambda instance: pickle.loads(pickle.dumps(instance))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+@pytest.mark.parametrize(
+    "instance", frozen_slotted_instances, ids=lambda instance: type(instance).__name__
+)
+def test_duplicate_equal(instance, duplicate):
+    duplicated = duplicate(instance)
+
+    assert duplicated == instance
+    assert duplicated.__getstate__() == instance.__getstate__()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
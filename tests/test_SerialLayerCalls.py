@@ -1,6 +1,6 @@
-import os
 import sys
 import pexpect
+from contextlib import closing
 import pytest
 from unittest import mock
 from serial import Serial
@@ -13,162 +13,492 @@ logging.basicConfig(
 
 shell_timeout_sec = 0.05
 
-# Add module directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Pseudo-terminal backed tests share module-level devices, keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group("serial")
 
 # Import modules under test
 from dwm1001.dwm1001 import DWM1001Node, AnchorNodeData, TagPosition, ParsingError
+from dwm1001.dwm1001 import AccelerometerData, poll_many
+from dwm1001.exceptions import ActiveStreamError
 from dwm1001.shell_command import ShellCommand
 
 # ************************* Mock Serial ************************* #
 # mock_serial = mock.Mock(Serial)
 # mock_serial.isOpen = lambda: True
 
+
+class _ChunkedSerial:
+    """! Serial stand-in that answers each write from a reply table and hands out
+    at most chunk_size bytes per read, to control how replies split across reads."""
+
+    name = "chunked"
+
+    def __init__(self, replies, chunk_size, timeout=None):
+        self.replies = replies
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.pending = bytearray()
+
+    @property
+    def in_waiting(self):
+        return min(len(self.pending), self.chunk_size)
+
+    def write(self, data):
+        self.pending += self.replies.get(bytes(data), b"")
+        return len(data)
+
+    def read(self, size=1):
+        chunk = bytes(self.pending[: min(size, self.chunk_size)])
+        del self.pending[: len(chunk)]
+        return chunk
+
+    def reset_input_buffer(self):
+        self.pending.clear()
+
+
 # ********************* DWM1001 In binary, but fails to shell mode *****#
-device_in_binary_mode_no_shell = MockSerial()
-device_in_binary_mode_no_shell.open()
-device_in_binary_mode_no_shell.stub(
-    name="is_in_binary_mode_check",
-    receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
-    send_bytes=b"@\x01\x01",
-)
+def _stub_binary_mode_no_shell(device):
+    device.stub(
+        name="is_in_binary_mode_check",
+        receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
+        send_bytes=b"@\x01\x01",
+    )
 
 
 # ********************* DWM1001 Node in shell mode ********************* #
-device_already_in_shell_mode = MockSerial()
-device_already_in_shell_mode.open()
-device_already_in_shell_mode.stub(
-    name="is_in_shell_mode_check",
-    receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
-    send_bytes=b"dwm> ",
-)
+def _stub_already_in_shell_mode(device):
+    device.stub(
+        name="is_in_shell_mode_check",
+        receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
+        send_bytes=b"dwm> ",
+    )
 
-device_already_in_shell_mode.stub(
-    name="reset_command",
-    receive_bytes=ShellCommand.RESET.value.encode() + b"\n",
-    send_bytes=b"",
-)
+    device.stub(
+        name="reset_command",
+        receive_bytes=ShellCommand.RESET.line_bytes,
+        send_bytes=b"",
+    )
+
+    device.stub(
+        name="system_info_command",
+        receive_bytes=ShellCommand.GET_SYSTEM_INFO.line_bytes,
+        send_bytes=b"System Info Response\r\ndwm> ",
+    )
 
-device_already_in_shell_mode.stub(
-    name="system_info_command",
-    receive_bytes=ShellCommand.GET_SYSTEM_INFO.value.encode() + b"\n",
-    send_bytes=b"System Info Response\r\ndwm> ",
-)
 
 # ********************* DWM1001 Node in binary mode ********************* #
-device_in_binary_mode = MockSerial()
-device_in_binary_mode.open()
-device_in_binary_mode.stub(
-    name="is_in_binary_mode_check",
-    receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
-    send_bytes=b"@\x01\x01",
-)
+def _stub_binary_mode(device):
+    device.stub(
+        name="is_in_binary_mode_check",
+        receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
+        send_bytes=b"@\x01\x01",
+    )
+
+    device.stub(
+        name="enter_shell_mode",
+        receive_bytes=ShellCommand.DOUBLE_ENTER.value.encode(),
+        send_bytes=b"dwm> ",
+    )
+
+
+# Each mock device is opened once per module and closed after its last test;
+# tests get its port with stale input drained
+@pytest.fixture(scope="module")
+def serial_ports():
+    stubs = {
+        "shell_mode": _stub_already_in_shell_mode,
+        "binary_mode": _stub_binary_mode,
+        "binary_mode_no_shell": _stub_binary_mode_no_shell,
+    }
+    devices = {}
+    ports = {}
+    for name, stub in stubs.items():
+        devices[name] = device = MockSerial()
+        device.open()
+        stub(device)
+        ports[name] = Serial(device.port)
+    yield ports
+    for name in stubs:
+        ports[name].close()
+        devices[name].close()
+
+
+def _drained(serial):
+    serial.reset_input_buffer()
+    return serial
+
+
+@pytest.fixture
+def shell_mode_serial(serial_ports):
+    return _drained(serial_ports["shell_mode"])
+
+
+@pytest.fixture
+def binary_mode_serial(serial_ports):
+    return _drained(serial_ports["binary_mode"])
+
+
+@pytest.fixture
+def binary_mode_no_shell_serial(serial_ports):
+    return _drained(serial_ports["binary_mode_no_shell"])
 
-device_in_binary_mode.stub(
-    name="enter_shell_mode",
-    receive_bytes=ShellCommand.DOUBLE_ENTER.value.encode(),
-    send_bytes=b"dwm> ",
-)
 
 # *********************************************************************** #
 # *********************** Test Cases ************************************ #
 # *********************************************************************** #
-def test_already_in_shell_mode():
-    serial = Serial(device_already_in_shell_mode.port)
-    dwm1001node = DWM1001Node(serial)
+def test_already_in_shell_mode(shell_mode_serial):
+    dwm1001node = DWM1001Node(shell_mode_serial)
     assert dwm1001node.is_in_shell_mode() == True
 
 
-def test_in_binary_mode():
-    serial = Serial(device_in_binary_mode.port)
-    dwm1001node = DWM1001Node(serial)
+def test_in_binary_mode(binary_mode_serial):
+    dwm1001node = DWM1001Node(binary_mode_serial)
     assert dwm1001node.is_in_shell_mode() == False
 
 
-def test_in_binary_mode_change_to_shell():
-    serial = Serial(device_in_binary_mode.port)
-    dwm1001node = DWM1001Node(serial)
+def test_in_binary_mode_change_to_shell(binary_mode_serial):
+    dwm1001node = DWM1001Node(binary_mode_serial)
     dwm1001node.connect()
     assert dwm1001node.is_in_shell_mode() == False
 
 
-def test_enter_shell_mode():
-    serial = Serial(device_already_in_shell_mode.port)
-    dwm1001node = DWM1001Node(serial)
+def test_enter_shell_mode(shell_mode_serial):
+    dwm1001node = DWM1001Node(shell_mode_serial)
     dwm1001node.connect()
     assert dwm1001node.is_in_shell_mode() == True
 
 
-def test_connect_shell_mode_timeout():
-    serial = Serial(device_in_binary_mode_no_shell.port)
-    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+def test_connect_shell_mode_timeout(binary_mode_no_shell_serial):
+    dwm1001node = DWM1001Node(
+        binary_mode_no_shell_serial, shell_timeout_sec=shell_timeout_sec
+    )
     with pytest.raises(pexpect.exceptions.TIMEOUT):
         dwm1001node.connect()
 
-def test_reset():
-    serial = Serial(device_already_in_shell_mode.port)
-    dwm1001node = DWM1001Node(serial)
+
+def test_enter_shell_mode_after_missed_probe():
+    # Already in shell mode, but the probe reply was missed: both enters get a prompt,
+    # the second one in a later read
+    serial = _ChunkedSerial(
+        {
+            ShellCommand.DOUBLE_ENTER.value.encode(): b"\r\ndwm> \r\ndwm> ",
+            ShellCommand.GET_UPTIME.line_bytes: (
+                b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> "
+            ),
+        },
+        chunk_size=len(b"\r\ndwm> "),
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    dwm1001node.connect()
+    assert dwm1001node.get_uptime_ms() == 2673760
+
+
+def test_serial_timeout_left_as_set():
+    serial = _ChunkedSerial({}, chunk_size=64, timeout=5)
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    assert dwm1001node.is_in_shell_mode() == False
+    with pytest.raises(pexpect.exceptions.TIMEOUT):
+        dwm1001node.get_command_output(ShellCommand.GET_UPTIME)
+    assert serial.timeout == 5
+
+
+def test_reset(shell_mode_serial, short_reset_timeout):
+    dwm1001node = DWM1001Node(shell_mode_serial)
     dwm1001node.connect()
     dwm1001node.reset()
     assert dwm1001node.is_in_shell_mode() == True
 
 
-def test_disconnect():
-    serial = Serial(device_already_in_shell_mode.port)
-    dwm1001node = DWM1001Node(serial)
+def test_reset_ignores_shell_prompt(shell_mode_serial, short_reset_timeout, caplog):
+    # A prompt after reset comes from the shell before the reboot, not the rebooted node
+    dwm1001node = DWM1001Node(shell_mode_serial)
+    dwm1001node.connect()
+    dwm1001node.reset()
+    assert "Timeout while waiting for the DWM1001 to reset." in caplog.text
+    with mock.patch.object(
+        dwm1001node, "is_in_shell_mode", return_value=True
+    ) as is_in_shell_mode:
+        dwm1001node.enter_shell_mode()
+    is_in_shell_mode.assert_called_once()
+
+
+def test_reset_binary_mode_reply(mock_device, caplog):
+    device, serial = mock_device()
+    device.stub(
+        name="reset_command",
+        receive_bytes=ShellCommand.RESET.line_bytes,
+        send_bytes=b"",
+    )
+    device.stub(
+        name="is_in_binary_mode_check",
+        receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
+        send_bytes=b"@\x01\x01",
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    dwm1001node.reset()
+    assert "Timeout while waiting for the DWM1001 to reset." not in caplog.text
+    with mock.patch.object(
+        dwm1001node, "is_in_shell_mode", return_value=True
+    ) as is_in_shell_mode:
+        dwm1001node.enter_shell_mode()
+    is_in_shell_mode.assert_called_once()
+
+
+def test_reset_timeout(mock_device, short_reset_timeout, caplog):
+    device, serial = mock_device()
+    device.stub(
+        name="reset_command",
+        receive_bytes=ShellCommand.RESET.line_bytes,
+        send_bytes=b"",
+    )
+    device.stub(
+        name="silent_mode_probe",
+        receive_bytes=b"a" + ShellCommand.ENTER.value.encode(),
+        send_bytes=b"",
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    dwm1001node.reset()
+    assert "Timeout while waiting for the DWM1001 to reset." in caplog.text
+
+
+def test_disconnect(shell_mode_serial, short_reset_timeout):
+    dwm1001node = DWM1001Node(shell_mode_serial)
     dwm1001node.disconnect()
     # Just checking that no error is raised - it calls reset
 
-def test_get_uptime_ms():
+
+def test_get_uptime_ms(mock_device):
     expected_uptime_ms = 2673760
     uptime_return_str = (
         "ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> "
     )
 
-    device = MockSerial()
-    device.open()
+    device, serial = mock_device()
     device.stub(
         name="uptime_command",
-        receive_bytes=ShellCommand.GET_UPTIME.value.encode() + b"\n",
+        receive_bytes=ShellCommand.GET_UPTIME.line_bytes,
         send_bytes=uptime_return_str.encode(),
     )
 
-    serial = Serial(device.port)
     dwm1001node = DWM1001Node(serial)
     actual_uptime_ms = dwm1001node.get_uptime_ms()
     assert actual_uptime_ms == expected_uptime_ms
 
 
-def test_get_system_info():
-    serial = Serial(device_already_in_shell_mode.port)
+def test_stream_accelerometer(mock_device):
+    expected_accelerometer_data = AccelerometerData(x_raw=-256, y_raw=1424, z_raw=8032)
+
+    device, serial = mock_device()
+    device.stub(
+        name="accelerometer_command",
+        receive_bytes=ShellCommand.GET_ACCELEROMETER.line_bytes,
+        send_bytes=b"av\r\nacc: x = -256, y = 1424, z = 8032\r\ndwm> ",
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    samples = dwm1001node.stream_accelerometer()
+    for _ in range(3):
+        assert next(samples) == expected_accelerometer_data
+    samples.close()
+
+
+def test_commands_rejected_while_accelerometer_stream_open(mock_device):
+    device, serial = mock_device()
+    device.stub(
+        name="accelerometer_command",
+        receive_bytes=ShellCommand.GET_ACCELEROMETER.line_bytes,
+        send_bytes=b"av\r\nacc: x = -256, y = 1424, z = 8032\r\ndwm> ",
+    )
+    device.stub(
+        name="uptime_command",
+        receive_bytes=ShellCommand.GET_UPTIME.line_bytes,
+        send_bytes=b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> ",
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    with closing(dwm1001node.stream_accelerometer()) as samples:
+        next(samples)
+        with pytest.raises(ActiveStreamError):
+            dwm1001node.get_accelerometer_data()
+        with pytest.raises(ActiveStreamError):
+            next(dwm1001node.stream_positions())
+        assert next(samples) == AccelerometerData(x_raw=-256, y_raw=1424, z_raw=8032)
+    assert dwm1001node.get_uptime_ms() == 2673760
+
+
+def test_poll_many(mock_device):
+    nodes = []
+    for _ in range(2):  # One mock device per node, as with real tags
+        device, serial = mock_device()
+        device.stub(
+            name="uptime_command",
+            receive_bytes=ShellCommand.GET_UPTIME.line_bytes,
+            send_bytes=b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> ",
+        )
+        nodes.append(DWM1001Node(serial))
+
+    assert poll_many(nodes, DWM1001Node.get_uptime_ms) == [2673760, 2673760]
+    assert poll_many([], DWM1001Node.get_uptime_ms) == []
+
+
+def test_get_command_outputs(mock_device):
+    device, serial = mock_device()
+    device.stub(
+        name="pipelined_commands",
+        receive_bytes=b"ut\rapg\r",
+        send_bytes=(
+            b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> "
+            b"apg\r\nx:10 y:78888 z:-334 qf:57\r\ndwm> "
+        ),
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    uptime_str, position_str = dwm1001node.get_command_outputs(
+        [ShellCommand.GET_UPTIME, ShellCommand.GET_POSITION.value]
+    )
+    assert dwm1001node._parse_uptime_str(uptime_str) == 2673760
+    assert position_str == "apg\r\nx:10 y:78888 z:-334 qf:57"
+
+
+def test_get_command_outputs_unaligned_chunks():
+    # Eight ~1.4 KB replies, more than 8 KiB in total, in reads that split the prompts
+    system_info_reply = b"si\r\n" + b"[036167.230 INF]  fw_size[0]=x0001F000\r\n" * 36
+    uptime_reply = b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)"
+    system_info_commands = ShellCommand.GET_SYSTEM_INFO.line_bytes * 8
+    serial = _ChunkedSerial(
+        {
+            system_info_commands: (system_info_reply + b"dwm> ") * 8,
+            ShellCommand.GET_UPTIME.line_bytes: uptime_reply + b"\r\ndwm> ",
+        },
+        chunk_size=100,
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    outputs = dwm1001node.get_command_outputs([ShellCommand.GET_SYSTEM_INFO] * 8)
+    assert outputs == [system_info_reply.strip().decode()] * 8
+    assert dwm1001node.get_uptime_ms() == 2673760
+
+
+def test_get_command_output_large_reply():
+    anchor_line = (
+        b"[003976.620 INF]   0) id=000000000000C920 seat=0 idl=0 seens=40 lqi=0 "
+        b"fl=5001 map=00000000 pos=0.38:0.84:2.15\r\n"
+    )
+    anchor_list_reply = b"la\r\n" + anchor_line * 100  # Over 8 KiB
+    serial = _ChunkedSerial(
+        {
+            ShellCommand.GET_ANCHOR_LIST.line_bytes: anchor_list_reply + b"dwm> ",
+            ShellCommand.GET_UPTIME.line_bytes: (
+                b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> "
+            ),
+        },
+        chunk_size=100,
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    assert len(dwm1001node.get_list_of_anchors()) == 100
+    assert dwm1001node.get_uptime_ms() == 2673760
+
+
+def test_stream_positions(mock_device):
+    expected_position = TagPosition(x_m=0.01, y_m=78.888, z_m=-0.334, quality=57)
+
+    device, serial = mock_device()
+    device.stub(
+        name="position_command",
+        receive_bytes=ShellCommand.GET_POSITION.line_bytes,
+        send_bytes=b"apg\r\nx:10 y:78888 z:-334 qf:57\r\ndwm> ",
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    positions = dwm1001node.stream_positions()
+    for _ in range(3):
+        assert next(positions) == expected_position
+    positions.close()
+
+
+def test_commands_rejected_while_position_stream_open(mock_device):
+    device, serial = mock_device()
+    device.stub(
+        name="position_command",
+        receive_bytes=ShellCommand.GET_POSITION.line_bytes,
+        send_bytes=b"apg\r\nx:10 y:78888 z:-334 qf:57\r\ndwm> ",
+    )
+    device.stub(
+        name="uptime_command",
+        receive_bytes=ShellCommand.GET_UPTIME.line_bytes,
+        send_bytes=b"ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> ",
+    )
+
+    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+    positions = dwm1001node.stream_positions()
+    next(positions)
+    with pytest.raises(ActiveStreamError):
+        dwm1001node.get_uptime_ms()
+    with pytest.raises(ActiveStreamError):
+        dwm1001node.get_command_outputs([ShellCommand.GET_UPTIME])
+    with pytest.raises(ActiveStreamError):
+        next(dwm1001node.stream_positions())
+    assert next(positions) == TagPosition(x_m=0.01, y_m=78.888, z_m=-0.334, quality=57)
+
+    positions.close()
+    assert dwm1001node.get_uptime_ms() == 2673760
+
+
+def test_get_command_output_bytes(mock_device):
+    uptime_return_str = (
+        "ut\r\n[002673.760 INF] uptime: 00:44:33.760 0 days (2673760 ms)\r\ndwm> "
+    )
+
+    device, serial = mock_device()
+    device.stub(
+        name="uptime_command",
+        receive_bytes=ShellCommand.GET_UPTIME.line_bytes,
+        send_bytes=uptime_return_str.encode(),
+    )
+
     dwm1001node = DWM1001Node(serial)
+    output = dwm1001node.get_command_output_bytes(ShellCommand.GET_UPTIME)
+    assert output == uptime_return_str[: -len("dwm> ")].encode()
+
+
+def test_get_system_info(shell_mode_serial):
+    dwm1001node = DWM1001Node(shell_mode_serial)
     system_info_response = dwm1001node.get_system_info()
     assert system_info_response is not None
 
-def test_get_command_output_timeout():
-    device = MockSerial()
-    device.open()
-    serial = Serial(device.port)
+
+def test_get_command_output_timeout(mock_device):
+    _, serial = mock_device()
     dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
     with pytest.raises(pexpect.exceptions.TIMEOUT):
         dwm1001node.get_command_output(ShellCommand.GET_UPTIME.value)
 
-def test_is_in_shell_mode_timeout():
-    device = MockSerial()
-    device.open()
-    serial = Serial(device.port)
+
+def test_is_in_shell_mode_timeout(mock_device):
+    _, serial = mock_device()
     dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
     is_in_shell_mode_expected = False
     is_in_shell_mode_actual = dwm1001node.is_in_shell_mode()
     assert is_in_shell_mode_actual == is_in_shell_mode_expected
 
-def test_already_in_shell_mode_when_trying_to_enter_shell_mode():
-    serial = Serial(device_already_in_shell_mode.port)
-    dwm1001node = DWM1001Node(serial, shell_timeout_sec=shell_timeout_sec)
+
+def test_already_in_shell_mode_when_trying_to_enter_shell_mode(shell_mode_serial):
+    dwm1001node = DWM1001Node(shell_mode_serial, shell_timeout_sec=shell_timeout_sec)
     dwm1001node.enter_shell_mode()
     # Just checking that no error is raised - it should already be in shell mode
 
 
+def test_enter_shell_mode_skips_probe_after_connect(shell_mode_serial):
+    dwm1001node = DWM1001Node(shell_mode_serial, shell_timeout_sec=shell_timeout_sec)
+    dwm1001node.connect()
+    with mock.patch.object(dwm1001node, "is_in_shell_mode") as is_in_shell_mode:
+        dwm1001node.enter_shell_mode()
+    is_in_shell_mode.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,5 @@
-import os
-import sys
 import pytest
-
-# Add module directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from dataclasses import FrozenInstanceError
 
 # Import modules under test
 from dwm1001.dwm1001 import TagPosition, ParsingError
@@ -39,6 +35,15 @@ def test_from_string_advanced():
     assert position.quality == 57
 
 
+def test_from_string_mm_rounding():
+    apg_line = "x:9 y:13 z:-18 qf:100"
+    position = TagPosition.from_string(apg_line)
+
+    assert position.x_m == 0.009
+    assert position.y_m == 0.013
+    assert position.z_m == -0.018
+
+
 def test_from_string_invalid():
     apg_line = "invalid line garbage"
     with pytest.raises(ParsingError):
@@ -52,6 +57,27 @@ def test_exact_equality():
     assert position1 == position2
 
 
+def test_equality_other_type():
+    position = TagPosition(1.23, 4.56, 7.89, 42)
+
+    assert position != (1.23, 4.56, 7.89)
+    assert position != None
+
+
+def test_equal_positions_hash_equal():
+    position1 = TagPosition(1.23, 4.56, 7.89, 42)
+    position2 = TagPosition(1.23, 4.56, 7.89, 7)
+
+    assert hash(position1) == hash(position2)
+    assert len({position1, position2}) == 1
+
+
+def test_immutable():
+    position = TagPosition(1.23, 4.56, 7.89, 42)
+    with pytest.raises(FrozenInstanceError):
+        position.x_m = 0.0
+
+
 def test_almost_equality_equal():
     position1 = TagPosition(1.23, 4.56, 7.89, 42)
     position2 = TagPosition(1.2301, 4.5601, 7.8901, 42)
@@ -80,5 +106,19 @@ def test_get_as_list():
     assert position_list == [1.23, 4.56, 7.89]
 
 
+def test_from_strings_batch():
+    apg_lines = ["x:10 y:78888 z:-334 qf:57", "not a position", "x:0 y:9 z:0 qf:0"]
+    x_m, y_m, z_m, quality = TagPosition.from_strings_batch(apg_lines)
+
+    assert x_m == (0.01, 0.0)
+    assert y_m == (78.888, 0.009)
+    assert z_m == (-0.334, 0.0)
+    assert quality == (57, 0)
+
+
+def test_from_strings_batch_empty():
+    assert TagPosition.from_strings_batch(["dwm> "]) == ((), (), (), ())
+
+
 if __name__ == "__main__":
     pytest.main([__file__])